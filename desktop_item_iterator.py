@@ -1,16 +1,15 @@
 import os
-import json
-from pathlib import Path
-from typing import List, Optional
-from persistence_manager import PersistenceManager
+from typing import Dict, Iterator, List, Optional
 
 
 class DesktopItemIterator:
     """
-    Iterator for desktop items that scans ~/Desktop once on initialization,
-    filters out invisible/system files, and provides navigation methods.
+    Iterator over a pre-scanned, pre-filtered list of desktop items that
+    provides navigation methods. Scanning and filtering live in the GUI.
     """
     
+    __slots__ = ('items', 'current_index', '_index_by_path')
+    
     def __init__(self, items: List[str]):
         """
         Initialize the iterator with a specific list of items.
@@ -20,47 +19,42 @@ class DesktopItemIterator:
         """
         self.items: List[str] = items
         self.current_index: int = 0
+        # Path -> position lookup, built on first use and dropped on removal
+        self._index_by_path: Optional[Dict[str, int]] = None
+
+    def restore_position(self, saved_item: Optional[str], saved_index: int, same_items: bool = False) -> None:
+        """
+        Move to where a previous session left off.
+        
+        Args:
+            saved_item: Path of the item that was current, or None
+            saved_index: Index that was current
+            same_items: True if the saved state was for exactly this item list
+        """
+        self.current_index = self._determine_starting_index(saved_item, saved_index, same_items)
 
-    def _determine_starting_index(self, saved_items: List[str], saved_index: int) -> int:
+    def _determine_starting_index(self, saved_item: Optional[str], saved_index: int, same_items: bool) -> int:
         """
         Determines the starting index for the new session.
         It tries to find the last viewed item from the previous session in the new list of items.
         """
+        # The list is unchanged, so the saved index still points at the same item
+        if same_items and 0 <= saved_index < len(self.items):
+            return saved_index
+
         # Check if there was a valid saved state
-        if not saved_items or not (0 <= saved_index < len(saved_items)):
+        if saved_item is None:
             return 0  # No valid saved state, start from the beginning
 
         # Get the path of the item from the last session
-        last_viewed_item_path = saved_items[saved_index]
+        last_viewed_item_path = saved_item
 
-        # Try to find that same item in the newly scanned list
-        try:
-            new_index = self.items.index(last_viewed_item_path)
-            return new_index
-        except ValueError:
-            # The last viewed item is no longer in the list (e.g., deleted, or handled)
-            return 0
-    
-    def _should_skip_file(self, filename: str) -> bool:
-        """
-        Determine if a file should be skipped based on filtering rules.
-        
-        Args:
-            filename: The name of the file to check
-            
-        Returns:
-            True if the file should be skipped, False otherwise
-        """
-        # Skip dotfiles (files starting with .)
-        if filename.startswith('.'):
-            return True
-        
-        # Skip specific system files
-        system_files = {'.DS_Store', '.localized'}
-        if filename in system_files:
-            return True
-        
-        return False
+        if self._index_by_path is None:
+            self._index_by_path = {path: i for i, path in enumerate(self.items)}
+
+        # Try to find that same item in the newly scanned list; fall back to the
+        # start if it is gone (e.g., deleted, or handled)
+        return self._index_by_path.get(last_viewed_item_path, 0)
     
     def next(self) -> Optional[str]:
         """
@@ -69,12 +63,6 @@ class DesktopItemIterator:
         Returns:
             The absolute path of the next item, or None if at the end
         """
-        if not self.items:
-            return None
-        
-        # Ensure current index is valid before proceeding
-        self._ensure_valid_index()
-        
         if self.current_index < len(self.items) - 1:
             self.current_index += 1
             return self.items[self.current_index]
@@ -88,12 +76,6 @@ class DesktopItemIterator:
         Returns:
             The absolute path of the previous item, or None if at the beginning
         """
-        if not self.items:
-            return None
-        
-        # Ensure current index is valid before proceeding
-        self._ensure_valid_index()
-        
         if self.current_index > 0:
             self.current_index -= 1
             return self.items[self.current_index]
@@ -112,6 +94,26 @@ class DesktopItemIterator:
         
         return self.items[self.current_index]
     
+    def current_name(self) -> Optional[str]:
+        """
+        Get the file name of the current item.
+        
+        Returns:
+            The base name of the current item, or None if no items
+        """
+        current_path = self.current()
+        return os.path.basename(current_path) if current_path else None
+    
+    def current_suffix(self) -> str:
+        """
+        Get the lowercased extension of the current item.
+        
+        Returns:
+            The extension including the leading dot, or '' if there is none
+        """
+        current_path = self.current()
+        return os.path.splitext(current_path)[1].lower() if current_path else ''
+    
     def reset(self) -> None:
         """Reset the iterator to the first item."""
         self.current_index = 0
@@ -130,20 +132,62 @@ class DesktopItemIterator:
     
     def is_at_end(self) -> bool:
         """Check if iterator is at the last item."""
-        return self.current_index >= len(self.items) - 1 if self.items else True
+        # An empty list gives -1, so this is also True when there are no items
+        return self.current_index >= len(self.items) - 1
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all item paths without moving the index."""
+        return iter(self.items)
     
     def __str__(self) -> str:
         """String representation of the iterator state."""
         if not self.items:
             return "DesktopItemIterator: No items found"
         
-        current_item = Path(self.current()).name if self.current() else "None"
+        current_item = self.current_name() or "None"
         return f"DesktopItemIterator: {self.current_index + 1}/{len(self.items)} - {current_item}"
     
     def __repr__(self) -> str:
         """Detailed representation of the iterator."""
         return f"DesktopItemIterator(items={len(self.items)}, index={self.current_index})"
     
+    def remove_current(self) -> Optional[str]:
+        """
+        Remove the current item from the list, keeping the index in bounds.
+        
+        Returns:
+            The absolute path of the removed item, or None if no items
+        """
+        if not 0 <= self.current_index < len(self.items):
+            return None
+        
+        removed = self.items.pop(self.current_index)
+        self._index_by_path = None
+        self._ensure_valid_index()
+        return removed
+    
+    def remove_item(self, file_path: str) -> bool:
+        """
+        Remove an item by path, keeping the index on the same current item.
+        
+        Args:
+            file_path: Absolute path of the item to remove
+            
+        Returns:
+            True if the item was found and removed, False otherwise
+        """
+        try:
+            index = self.items.index(file_path)
+        except ValueError:
+            return False
+        
+        del self.items[index]
+        if index < self.current_index:
+            self.current_index -= 1
+        self._index_by_path = None
+        self._ensure_valid_index()
+        return True
+    
     def current_item_path(self) -> Optional[str]:
         """Get the path of the current item for actions."""
         return self.current()
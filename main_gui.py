@@ -6,109 +6,299 @@ Wires together the iterator and preview providers for a complete desktop managem
 
 import sys
 import os
+import stat
 import shutil
-from pathlib import Path
+from collections import OrderedDict
 from typing import Optional
 from datetime import datetime
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QStatusBar, QSplitter, QFrame, QScrollArea,
-    QMessageBox, QProgressBar, QFileDialog, QMenuBar, QAction
+    QMessageBox, QProgressBar, QFileDialog, QMenuBar, QAction, QShortcut,
+    QStackedWidget, QCheckBox
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import Qt, QTimer, QObject, QThread, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QFont, QIcon, QKeySequence
 
 from desktop_item_iterator import DesktopItemIterator
 from preview_provider import (
-    ImagePreview, PDFPreview, TextPreview, DirectoryPreview, GenericPreview, SvgPreview, DocxPreview, RtfPreview, XlsxPreview
+    cached_font, remove_thumbnails, ImagePreview, PDFPreview, TextPreview, DirectoryPreview, GenericPreview, SvgPreview, DocxPreview, RtfPreview, XlsxPreview
 )
 from persistence_manager import PersistenceManager
 from send2trash import send2trash
 
 
+# Providers whose decode runs on a pool thread; the rest build widgets directly
+_BACKGROUND_PROVIDERS = (ImagePreview, PDFPreview)
+
+# Resolved once at import; the home directory doesn't change while running.
+# DESKTOP_CLEANER_DESKTOP points the app at another folder (e.g. a sandbox)
+DESKTOP_PATH = os.path.abspath(os.environ.get("DESKTOP_CLEANER_DESKTOP") or os.path.expanduser("~/Desktop"))
+
+# Delay before a preview is loaded after navigating, in milliseconds
+PREVIEW_DEBOUNCE_MS = 120
+
+# Number of built preview widgets kept around for quick back/forward
+PREVIEW_CACHE_SIZE = 8
+
+# Idle time after a preview is shown before neighbours are prefetched, in milliseconds
+PREFETCH_DELAY_MS = 300
+
+# Delay used to coalesce iterator state saves, in milliseconds
+SAVE_DEBOUNCE_MS = 500
+
+# Desktop entries that are never shown: dotfiles (which also covers macOS
+# .DS_Store and .localized) plus Finder/Explorer metadata without a dot
+_SKIP_PREFIXES = ('.',)
+_SKIP_EXACT = frozenset({'Icon\r', 'desktop.ini', 'Thumbs.db'})
+
+
+# File extension (lowercase, with dot) -> preview provider class
+_EXT_TO_PROVIDER = {
+    # Image files
+    **{ext: ImagePreview for ext in ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')},
+    # Documents
+    '.pdf': PDFPreview,
+    '.svg': SvgPreview,
+    '.docx': DocxPreview,
+    '.rtf': RtfPreview,
+    '.rtfd': RtfPreview,
+    '.xlsx': XlsxPreview,
+    # Text files
+    **{ext: TextPreview for ext in ('.txt', '.py', '.js', '.html', '.css', '.json', '.xml',
+                                    '.csv', '.md', '.yml', '.yaml')},
+}
+
+
+def _looks_textual(file_path: str, sample_size: int = 4096) -> bool:
+    """
+    Guess whether a file holds text by sniffing its first bytes.
+    
+    Args:
+        file_path: Path to the file to check
+        sample_size: Number of leading bytes to inspect
+        
+    Returns:
+        True if the sample contains no NUL bytes, False otherwise or on error
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(sample_size)
+    except OSError:
+        return False
+    # Binary formats almost always contain NUL bytes early on; text never does
+    return b'\x00' not in head
+
+
+class PreviewStack(QStackedWidget):
+    """Stacked widget that sizes itself to the visible page only."""
+    
+    # QStackedWidget reports the largest page's size hint, which would let a
+    # hidden cached preview force scroll bars onto a small visible one
+    def sizeHint(self):
+        current = self.currentWidget()
+        return current.sizeHint() if current is not None else super().sizeHint()
+    
+    def minimumSizeHint(self):
+        current = self.currentWidget()
+        return current.minimumSizeHint() if current is not None else super().minimumSizeHint()
+
+
 class PreviewProviderManager:
     """Manages selection of appropriate preview provider based on file type."""
     
     @staticmethod
-    def get_preview_provider(file_path: str):
+    def get_preview_provider(file_path: str, stat_result: Optional[os.stat_result] = None):
         """
         Choose and return the appropriate preview provider for the given file.
         
         Args:
             file_path: Path to the file to preview
+            stat_result: Stat result of the file, if the caller has one; the
+                provider reuses it for metadata instead of stat()ing again
             
         Returns:
             Appropriate preview provider instance
         """
-        path_obj = Path(file_path)
-        
-        # Check if it's a directory
-        if path_obj.is_dir():
-            return DirectoryPreview(file_path)
+        # Check if it's a directory, from the caller's stat result when there is one
+        if stat_result is not None:
+            is_dir = stat.S_ISDIR(stat_result.st_mode)
+        else:
+            is_dir = os.path.isdir(file_path)
+        if is_dir:
+            return DirectoryPreview(file_path, stat_result=stat_result)
         
-        # Get file extension
-        extension = path_obj.suffix.lower()
+        provider_class = _EXT_TO_PROVIDER.get(os.path.splitext(file_path)[1].lower())
+        if provider_class is not None:
+            return provider_class(file_path, stat_result=stat_result)
         
-        # Image files
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
-        if extension in image_extensions:
-            return ImagePreview(file_path)
+        # Try text preview for files with no extension or unknown extensions,
+        # but only when the content looks like text
+        if _looks_textual(file_path):
+            return TextPreview(file_path, stat_result=stat_result)
         
-        # PDF files
-        if extension == '.pdf':
-            return PDFPreview(file_path)
+        # Default to generic preview
+        return GenericPreview(file_path, stat_result=stat_result)
+
+
+class DesktopScanWorker(QObject):
+    """Scans the desktop on a background thread so the UI stays responsive."""
+    scanned = pyqtSignal(list)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal()
+    
+    def __init__(self, desktop_path: str, left_paths, should_skip_file):
+        """
+        Initialize the scan worker.
         
-        # SVG files
-        if extension == '.svg':
-            return SvgPreview(file_path)
+        Args:
+            desktop_path: Directory to scan
+            left_paths: Set of paths the user chose to leave on the desktop
+            should_skip_file: Callable deciding whether a file name is hidden
+        """
+        super().__init__()
+        self.desktop_path = desktop_path
+        self.left_paths = left_paths
+        self.should_skip_file = should_skip_file
+    
+    def run(self):
+        """Scan the desktop and emit the sorted list of unhandled item paths."""
+        try:
+            # Drop hidden files and items the user chose to leave
+            # (see PersistenceManager.filter_unhandled_items) in one pass
+            unhandled_items = []
+            if os.path.isdir(self.desktop_path):
+                # os.scandir yields entries straight from the directory listing,
+                # so no per-item Path objects or extra stat() calls are needed
+                with os.scandir(self.desktop_path) as it:
+                    entries = [entry for entry in it
+                               if not self.should_skip_file(entry.name)
+                               and entry.path not in self.left_paths]
+                # Sort on the short, case-folded name: it skips the shared
+                # desktop prefix and matches Finder's case-insensitive order
+                entries.sort(key=lambda entry: entry.name.casefold())
+                unhandled_items = [entry.path for entry in entries]
+            self.scanned.emit(unhandled_items)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.finished.emit()
 
-        # Word documents
-        if extension == '.docx':
-            return DocxPreview(file_path)
 
-        # RTF documents
-        if extension in ['.rtf', '.rtfd']:
-            return RtfPreview(file_path)
+class FileOperationSignals(QObject):
+    """Signals reporting the outcome of a FileOperationTask."""
+    done = pyqtSignal(str, str, str)  # action, source path, destination ('' for trash)
+    failed = pyqtSignal(str, str, str)  # action, source path, error message
 
-        # Excel spreadsheets
-        if extension == '.xlsx':
-            return XlsxPreview(file_path)
 
-        # Text files
-        text_extensions = {'.txt', '.py', '.js', '.html', '.css', '.json', '.xml', '.csv', '.md', '.yml', '.yaml'}
-        if extension in text_extensions:
-            return TextPreview(file_path)
+class FileOperationTask(QRunnable):
+    """Moves an item to a folder or to the trash on a pool thread."""
+    
+    def __init__(self, action: str, source_path: str, destination: Optional[str] = None):
+        """
+        Initialize the file operation.
         
-        # Excel spreadsheets
-        if extension == '.xlsx':
-            return XlsxPreview(file_path)
+        Args:
+            action: "moved" or "trashed"
+            source_path: Path of the item to move
+            destination: Target directory when action is "moved"
+        """
+        super().__init__()
+        self.action = action
+        self.source_path = source_path
+        self.destination = destination
+        self.signals = FileOperationSignals()
+    
+    def run(self):
+        """Perform the move or trash operation and report the outcome."""
+        try:
+            if self.action == "moved":
+                shutil.move(self.source_path, self.destination)
+            else:
+                send2trash(self.source_path)
+            self.signals.done.emit(self.action, self.source_path, self.destination or "")
+        except Exception as e:
+            self.signals.failed.emit(self.action, self.source_path, str(e))
 
-        # Try text preview for files with no extension or unknown extensions
-        if not extension or extension not in image_extensions.union(text_extensions).union({'.pdf', '.svg', '.docx', '.rtf', '.rtfd', '.xlsx'}):
-            try:
-                # Attempt to preview as text, but catch errors
-                test_preview = TextPreview(file_path)
-                # If it doesn't raise an error during init, it's likely text-like
-                return test_preview
-            except Exception:
-                # Fallback to GenericPreview if TextPreview fails
-                pass
 
-        # Default to generic preview
-        return GenericPreview(file_path)
+class PreviewRenderSignals(QObject):
+    """Signals reporting the outcome of a PreviewRenderTask."""
+    rendered = pyqtSignal(object, object, object)  # cache key, provider, render() result
+
+
+class PreviewRenderTask(QRunnable):
+    """Runs a preview provider's thread-safe render() step on a pool thread."""
+    
+    def __init__(self, cache_key, provider):
+        """
+        Initialize the render task.
+        
+        Args:
+            cache_key: (path, mtime_ns, size) key the result is cached under
+            provider: Provider with render() and build_widget() methods
+        """
+        super().__init__()
+        self.cache_key = cache_key
+        self.provider = provider
+        self.signals = PreviewRenderSignals()
+    
+    def run(self):
+        """Render the preview image and hand it back to the GUI thread."""
+        try:
+            result = self.provider.render()
+        except Exception as e:
+            result = (None, f"Error: {str(e)}", f"Preview not available\nError: {str(e)}")
+        self.signals.rendered.emit(self.cache_key, self.provider, result)
 
 
 class DesktopCleanerGUI(QMainWindow):
     """Main GUI window for the Desktop Cleaner application."""
     
+    # Keyboard shortcut -> name of the slot it triggers
+    _SHORTCUT_MAP = (
+        (Qt.Key_Left, 'prev_item'),      # Arrow key navigation
+        (Qt.Key_Right, 'next_item'),
+        (Qt.Key_Home, 'reset_iterator'),
+        (Qt.Key_F5, 'refresh_iterator'),
+    )
+    
     def __init__(self):
         super().__init__()
         self.iterator = None
+        self._desktop_path = DESKTOP_PATH  # Directory being cleaned, resolved once
         self.current_preview_widget = None
         self.current_metadata = ""
         self.current_preview_file = None  # Track which file the preview is showing
-        self.persistence_manager = PersistenceManager()
+        self._scan_thread = None  # Background desktop scan, if one is running
+        self._scan_worker = None
+        self._rescan_requested = False  # Refresh asked for while scanning
+        self._file_operation = None  # Move/trash task currently in flight
+        self._skip_confirm = False  # User opted out of confirmations this session
+        self._confirm_box = None  # Confirmation dialog, built on first use
+        self._last_ui_state = {}  # Last values update_ui pushed to its widgets
+        
+        # Coalesce preview loads while the user is navigating quickly
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.timeout.connect(self._do_load_current_preview)
+        # (path, mtime_ns, size) -> (preview widget, metadata), oldest first
+        self._preview_cache = OrderedDict()
+        # Build the previous/next previews while the user looks at this one
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.timeout.connect(self._prefetch_neighbors)
+        # Image/PDF decoding happens here so it never stalls the window
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(2)
+        self._render_tasks = {}  # cache key -> PreviewRenderTask in flight
+        self._pending_preview_key = None  # Render the current item is waiting on
+        # Coalesce iterator state saves into one write per burst of navigation
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._flush_iterator_state)
+        # Saves are written in one go from the save timer rather than per change
+        self.persistence_manager = PersistenceManager(autosave=False)
         self.persistence_manager.increment_session_count()
         
         self.init_ui()
@@ -158,26 +348,19 @@ class DesktopCleanerGUI(QMainWindow):
         
         # Title
         title_label = QLabel("Desktop Items")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(cached_font(14, bold=True))
         title_label.setAlignment(Qt.AlignCenter)
         control_layout.addWidget(title_label)
         
         # Current item info
         self.current_item_label = QLabel("No items found")
         self.current_item_label.setWordWrap(True)
-        item_font = QFont()
-        item_font.setPointSize(10)
-        self.current_item_label.setFont(item_font)
+        self.current_item_label.setFont(cached_font(10))
         control_layout.addWidget(self.current_item_label)
         
         # Position info
         self.position_label = QLabel("Position: 0/0")
-        position_font = QFont()
-        position_font.setPointSize(9)
-        self.position_label.setFont(position_font)
+        self.position_label.setFont(cached_font(9))
         control_layout.addWidget(self.position_label)
         
         # Progress bar
@@ -228,10 +411,7 @@ class DesktopCleanerGUI(QMainWindow):
         
         # Preview title
         preview_title = QLabel("Preview")
-        preview_font = QFont()
-        preview_font.setPointSize(14)
-        preview_font.setBold(True)
-        preview_title.setFont(preview_font)
+        preview_title.setFont(cached_font(14, bold=True))
         preview_title.setAlignment(Qt.AlignCenter)
         preview_layout.addWidget(preview_title)
         
@@ -243,19 +423,25 @@ class DesktopCleanerGUI(QMainWindow):
         # Default preview widget
         self.default_preview = QLabel("No item selected")
         self.default_preview.setAlignment(Qt.AlignCenter)
-        default_font = QFont()
-        default_font.setPointSize(12)
-        self.default_preview.setFont(default_font)
-        self.preview_scroll.setWidget(self.default_preview)
+        self.default_preview.setFont(cached_font(12))
+        
+        # Placeholder shown while a preview renders in the background
+        self.loading_preview = QLabel("Loading preview...")
+        self.loading_preview.setAlignment(Qt.AlignCenter)
+        self.loading_preview.setFont(cached_font(12))
+        
+        # Previews are swapped as pages of a stack so cached ones stay alive
+        self.preview_stack = PreviewStack()
+        self.preview_stack.addWidget(self.default_preview)
+        self.preview_stack.addWidget(self.loading_preview)
+        self.preview_scroll.setWidget(self.preview_stack)
         
         preview_layout.addWidget(self.preview_scroll)
         
         # Metadata label
         self.metadata_label = QLabel("No metadata available")
         self.metadata_label.setWordWrap(True)
-        metadata_font = QFont()
-        metadata_font.setPointSize(9)
-        self.metadata_label.setFont(metadata_font)
+        self.metadata_label.setFont(cached_font(9))
         self.metadata_label.setMaximumHeight(100)
         preview_layout.addWidget(self.metadata_label)
         
@@ -327,7 +513,7 @@ class DesktopCleanerGUI(QMainWindow):
                 return False
             
             # CRITICAL: Check if preview file matches current file
-            if hasattr(self, 'current_preview_file') and self.current_preview_file:
+            if self.current_preview_file:
                 if self.current_preview_file != file_path:
                     QMessageBox.critical(
                         self, "File Mismatch Error", 
@@ -338,24 +524,41 @@ class DesktopCleanerGUI(QMainWindow):
                     )
                     return False
             
+            # The safety checks above always run; only the question is skippable
+            if self._skip_confirm:
+                return True
+            
             # Get file info for verification
             file_stat = os.stat(file_path)
             file_name = os.path.basename(file_path)
             
             # Show confirmation dialog with file details
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Question)
-            msg.setWindowTitle("Confirm File Operation")
+            msg = self._get_confirm_box()
             msg.setText(f"You are about to move:\n\n{file_name}\n\nSize: {file_stat.st_size:,} bytes\nModified: {datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')}\n\nIs this the correct file?")
-            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-            msg.setDefaultButton(QMessageBox.Yes)
+            # Opting out always takes a tick on this confirmation, not an earlier one
+            msg.checkBox().setChecked(False)
             
-            return msg.exec_() == QMessageBox.Yes
+            confirmed = msg.exec_() == QMessageBox.Yes
+            # Only a confirmed operation turns the question off
+            if confirmed and msg.checkBox().isChecked():
+                self._skip_confirm = True
+            return confirmed
             
         except Exception as e:
             QMessageBox.warning(self, "Verification Error", f"Could not verify file: {e}")
             return False
     
+    def _get_confirm_box(self) -> QMessageBox:
+        """Get the file operation confirmation dialog, creating it once."""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Question)
+            self._confirm_box.setWindowTitle("Confirm File Operation")
+            self._confirm_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+            self._confirm_box.setDefaultButton(QMessageBox.Yes)
+            self._confirm_box.setCheckBox(QCheckBox("Don't ask again this session"))
+        return self._confirm_box
+    
     def move_to_folder(self):
         """Move the item to a selected folder."""
         if not self.iterator or not self.iterator.current_item_path():
@@ -363,6 +566,10 @@ class DesktopCleanerGUI(QMainWindow):
         
         current_item_path = self.iterator.current_item_path()
         
+        if self._preview_is_loading(current_item_path):
+            self.status_message.setText("Preview still loading - try again in a moment")
+            return
+        
         # CRITICAL: Verify file integrity before moving
         if not self.verify_file_integrity(current_item_path):
             self.status_message.setText("Move cancelled - file verification failed")
@@ -377,12 +584,9 @@ class DesktopCleanerGUI(QMainWindow):
                     self.handle_error("File no longer exists - it may have been moved or deleted")
                     return
                 
-                # Move the file to the selected directory
-                shutil.move(current_item_path, directory)
-                self.persistence_manager.mark_item_handled(current_item_path, "moved", directory)
-                self.status_message.setText(f"Moved to {directory}")
-                # Remove from iterator and advance
-                self.remove_current_item_and_advance()
+                # Move the file to the selected directory in the background
+                self.status_message.setText(f"Moving to {directory}...")
+                self._start_file_operation(FileOperationTask("moved", current_item_path, directory))
             except Exception as e:
                 self.handle_error(f"Failed to move file: {e}")
         # Skip to next if user cancels (no action needed)
@@ -394,6 +598,10 @@ class DesktopCleanerGUI(QMainWindow):
         
         current_item_path = self.iterator.current_item_path()
         
+        if self._preview_is_loading(current_item_path):
+            self.status_message.setText("Preview still loading - try again in a moment")
+            return
+        
         # CRITICAL: Verify file integrity before moving to trash
         if not self.verify_file_integrity(current_item_path):
             self.status_message.setText("Trash operation cancelled - file verification failed")
@@ -405,47 +613,100 @@ class DesktopCleanerGUI(QMainWindow):
                 self.handle_error("File no longer exists - it may have been moved or deleted")
                 return
                 
-            send2trash(current_item_path)
-            self.persistence_manager.mark_item_handled(current_item_path, "trashed")
-            self.status_message.setText("Moved to trash")
-            # Remove from iterator and advance
-            self.remove_current_item_and_advance()
+            self.status_message.setText("Moving to trash...")
+            self._start_file_operation(FileOperationTask("trashed", current_item_path))
         except Exception as e:
             self.handle_error(f"Failed to move to trash: {e}")
+    
+    def _start_file_operation(self, task: FileOperationTask):
+        """Run a move/trash task off the GUI thread, one at a time."""
+        # Large moves or a slow trash backend would otherwise freeze the window
+        self.move_button.setEnabled(False)
+        self.trash_button.setEnabled(False)
+        task.signals.done.connect(self._on_file_operation_done)
+        task.signals.failed.connect(self._on_file_operation_failed)
+        self._file_operation = task
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_file_operation_done(self, action: str, source_path: str, destination: str):
+        """Record a finished move/trash and drop the item from the iterator."""
+        self._file_operation = None
+        self.move_button.setEnabled(True)
+        self.trash_button.setEnabled(True)
+        
+        self.persistence_manager.mark_item_handled(source_path, action, destination or None)
+        # The file is gone from the desktop, so its rendered first page goes too
+        remove_thumbnails(source_path)
+        if action == "moved":
+            self.status_message.setText(f"Moved to {destination}")
+        else:
+            self.status_message.setText("Moved to trash")
+        # Remove from iterator and advance
+        self.remove_current_item_and_advance(source_path)
+    
+    def _on_file_operation_failed(self, action: str, source_path: str, message: str):
+        """Report a failed move/trash."""
+        self._file_operation = None
+        self.move_button.setEnabled(True)
+        self.trash_button.setEnabled(True)
+        
+        if action == "moved":
+            self.handle_error(f"Failed to move file: {message}")
+        else:
+            self.handle_error(f"Failed to move to trash: {message}")
 
     def setup_keyboard_shortcuts(self):
         """Setup keyboard shortcuts for navigation."""
-        from PyQt5.QtWidgets import QShortcut
-        from PyQt5.QtGui import QKeySequence
-        
-        # Arrow key navigation
-        QShortcut(QKeySequence(Qt.Key_Left), self, self.prev_item)
-        QShortcut(QKeySequence(Qt.Key_Right), self, self.next_item)
-        QShortcut(QKeySequence(Qt.Key_Home), self, self.reset_iterator)
-        QShortcut(QKeySequence(Qt.Key_F5), self, self.refresh_iterator)
+        for key, method_name in self._SHORTCUT_MAP:
+            QShortcut(QKeySequence(key), self, getattr(self, method_name))
     
     def init_iterator(self):
-        """Initialize the desktop item iterator."""
+        """Start scanning the desktop on a background thread."""
+        if self._scan_thread is not None:
+            # Rescan once the running scan ends so it sees the latest state
+            self._rescan_requested = True
+            return
+        
         try:
             self.status_message.setText("Loading desktop items...")
             self.progress_bar.setVisible(True)
             self.progress_bar.setRange(0, 0)  # Indeterminate progress
+            self.refresh_button.setEnabled(False)
             
-            # Scan desktop and filter items
-            desktop_path = Path.home() / "Desktop"
-            all_desktop_items = []
-            if desktop_path.exists():
-                for item in desktop_path.iterdir():
-                    if not self._should_skip_file(item.name):
-                        all_desktop_items.append(str(item.absolute()))
-            all_desktop_items.sort()
+            # The persistence manager is only touched on the GUI thread
+            left_paths = self.persistence_manager.get_left_paths()
             
-            # Filter out handled items using the persistence manager
-            unhandled_items = self.persistence_manager.filter_unhandled_items(all_desktop_items)
+            self._scan_thread = QThread(self)
+            self._scan_worker = DesktopScanWorker(self._desktop_path, left_paths, self._should_skip_file)
+            self._scan_worker.moveToThread(self._scan_thread)
+            self._scan_thread.started.connect(self._scan_worker.run)
+            self._scan_worker.scanned.connect(self._on_scan_complete)
+            self._scan_worker.failed.connect(self._on_scan_failed)
+            self._scan_worker.finished.connect(self._scan_thread.quit)
+            self._scan_thread.finished.connect(self._on_scan_thread_finished)
+            self._scan_thread.start()
+            
+        except Exception as e:
+            self._on_scan_thread_finished()
+            self.handle_error(f"Failed to load desktop items: {e}")
+    
+    def _on_scan_complete(self, unhandled_items):
+        """Finish initializing the iterator once the background scan is done."""
+        try:
+            # Record the outgoing iterator's position first on a refresh
+            if self._save_timer.isActive():
+                self._flush_iterator_state()
             
             # Initialize iterator with the unhandled items
             self.iterator = DesktopItemIterator(unhandled_items)
             
+            # Pick up where the last session (or the last refresh) left off
+            saved = self.persistence_manager.load_iterator_state()
+            self.iterator.restore_position(
+                saved["current_item"], saved["current_index"],
+                same_items=self.persistence_manager.iterator_items_match(unhandled_items)
+            )
+            
             self.progress_bar.setVisible(False)
             
             # Update UI
@@ -462,22 +723,31 @@ class DesktopCleanerGUI(QMainWindow):
             
         except Exception as e:
             self.handle_error(f"Failed to load desktop items: {e}")
+    
+    def _on_scan_failed(self, message: str):
+        """Report a failed background scan."""
+        self.handle_error(f"Failed to load desktop items: {message}")
+    
+    def _on_scan_thread_finished(self):
+        """Release the scan thread and worker once the scan has ended."""
+        if self._scan_worker is not None:
+            self._scan_worker.deleteLater()
+        if self._scan_thread is not None:
+            self._scan_thread.deleteLater()
+        self._scan_worker = None
+        self._scan_thread = None
+        self.refresh_button.setEnabled(True)
+        
+        if self._rescan_requested:
+            self._rescan_requested = False
+            self.init_iterator()
 
     def _should_skip_file(self, filename: str) -> bool:
         """
         Determine if a file should be skipped based on filtering rules.
         Moved from DesktopItemIterator to centralize logic.
         """
-        # Skip dotfiles (files starting with .)
-        if filename.startswith('.'):
-            return True
-        
-        # Skip specific system files
-        system_files = {'.DS_Store', '.localized'}
-        if filename in system_files:
-            return True
-        
-        return False
+        return filename.startswith(_SKIP_PREFIXES) or filename in _SKIP_EXACT
     
     def update_ui(self):
         """Update the UI elements based on current iterator state."""
@@ -490,67 +760,235 @@ class DesktopCleanerGUI(QMainWindow):
         
         # Update current item label
         if current_path:
-            item_name = Path(current_path).name
-            self.current_item_label.setText(f"Current: {item_name}")
+            item_name = os.path.basename(current_path)
+            item_text = f"Current: {item_name}"
         else:
-            self.current_item_label.setText("No items found")
+            item_text = "No items found"
+        self._apply_ui_value('item', item_text, self.current_item_label.setText)
         
         # Update position label
         if item_count > 0:
-            self.position_label.setText(f"Position: {current_index + 1}/{item_count}")
+            position_text = f"Position: {current_index + 1}/{item_count}"
         else:
-            self.position_label.setText("Position: 0/0")
-        
-        # Update button states
-        self.prev_button.setEnabled(not self.iterator.is_at_start() and item_count > 0)
-        self.next_button.setEnabled(not self.iterator.is_at_end() and item_count > 0)
-        self.reset_button.setEnabled(item_count > 0)
+            position_text = "Position: 0/0"
+        self._apply_ui_value('position', position_text, self.position_label.setText)
+        
+        # Update button states from the values read above rather than asking
+        # the iterator again (same as is_at_start/is_at_end)
+        self._apply_ui_value('prev', current_index > 0 and item_count > 0, self.prev_button.setEnabled)
+        self._apply_ui_value('next', current_index < item_count - 1, self.next_button.setEnabled)
+        self._apply_ui_value('reset', item_count > 0, self.reset_button.setEnabled)
+    
+    def _apply_ui_value(self, key: str, value, setter):
+        """Call a widget setter only if the value differs from the last one applied."""
+        # Every setText/setEnabled schedules a repaint, even for the same value
+        if key not in self._last_ui_state or self._last_ui_state[key] != value:
+            setter(value)
+            self._last_ui_state[key] = value
     
     def load_current_preview(self):
+        """Load the preview for the current item now, dropping any scheduled load."""
+        self._preview_timer.stop()
+        self._prefetch_timer.stop()
+        self._do_load_current_preview()
+    
+    def schedule_preview_load(self):
+        """
+        Schedule loading the preview for the current item.
+        Holding an arrow key restarts the timer, so only the item the user
+        stops on is actually decoded.
+        """
+        self._prefetch_timer.stop()
+        self._preview_timer.start(PREVIEW_DEBOUNCE_MS)
+    
+    def _preview_is_loading(self, file_path: str) -> bool:
+        """Check whether the preview of an item has not been shown yet."""
+        # A scheduled load is always for the current item; a background
+        # render only counts while the item is still waiting on it
+        if self._preview_timer.isActive():
+            return True
+        return self._pending_preview_key is not None and self._pending_preview_key[0] == file_path
+    
+    def _do_load_current_preview(self):
         """Load and display preview for the current item."""
         if not self.iterator:
             return
         
+        # Whatever the previous item was waiting for no longer gets shown
+        self._pending_preview_key = None
+        
         current_path = self.iterator.current()
         if not current_path:
             self.show_default_preview()
             return
         
-        # INTEGRITY CHECK: Verify file still exists before showing preview
-        if not os.path.exists(current_path):
+        # INTEGRITY CHECK: Verify file still exists before showing preview;
+        # the stat result also keys the preview cache
+        try:
+            file_stat = os.stat(current_path)
+        except OSError:
             self.handle_preview_error(current_path, Exception("File no longer exists"))
             return
         
         try:
             self.status_message.setText("Loading preview...")
             
+            # Reuse the widget built on an earlier visit if the file is unchanged
+            cache_key = (current_path, file_stat.st_mtime_ns, file_stat.st_size)
+            cached = self._preview_cache.get(cache_key)
+            if cached is not None:
+                self._preview_cache.move_to_end(cache_key)
+                self._show_preview(current_path, *cached)
+                return
+            
             # Get appropriate preview provider
-            provider = PreviewProviderManager.get_preview_provider(current_path)
+            provider = PreviewProviderManager.get_preview_provider(current_path, file_stat)
+            
+            if isinstance(provider, _BACKGROUND_PROVIDERS):
+                # Decode on the preview pool; _on_preview_rendered shows it.
+                # Move and Trash are refused while _pending_preview_key is set
+                self._pending_preview_key = cache_key
+                self._start_preview_render(cache_key, provider)
+                self._set_preview_widget(self.loading_preview)
+                self.metadata_label.setText("Loading metadata...")
+                self.current_preview_widget = None
+                return
             
             # Get preview widget and metadata
             preview_widget, metadata = provider.get_preview()
-            
-            # Update preview
             if preview_widget:
-                self.preview_scroll.setWidget(preview_widget)
-                self.current_preview_widget = preview_widget
-                # Store current file path for verification
-                self.current_preview_file = current_path
-            else:
-                self.show_default_preview()
-            
-            # Update metadata
-            self.metadata_label.setText(metadata if metadata else "No metadata available")
-            self.current_metadata = metadata
-            
-            self.status_message.setText("Preview loaded")
+                self._cache_preview(cache_key, preview_widget, metadata)
+            self._show_preview(current_path, preview_widget, metadata)
             
         except Exception as e:
             self.handle_preview_error(current_path, e)
     
+    def _show_preview(self, file_path: str, preview_widget: Optional[QWidget], metadata: str):
+        """Display a built preview and its metadata for the current item."""
+        # Update preview
+        if preview_widget:
+            self._set_preview_widget(preview_widget)
+            self.current_preview_widget = preview_widget
+            # Store current file path for verification
+            self.current_preview_file = file_path
+        else:
+            self.show_default_preview()
+        
+        # Update metadata
+        self.metadata_label.setText(metadata if metadata else "No metadata available")
+        self.current_metadata = metadata
+        
+        self.status_message.setText("Preview loaded")
+        self._prefetch_timer.start(PREFETCH_DELAY_MS)
+    
+    def _start_preview_render(self, cache_key, provider):
+        """Queue a background render unless that file version is already rendering."""
+        if cache_key in self._render_tasks:
+            return
+        task = PreviewRenderTask(cache_key, provider)
+        task.signals.rendered.connect(self._on_preview_rendered)
+        self._render_tasks[cache_key] = task
+        self._preview_pool.start(task)
+    
+    def _on_preview_rendered(self, cache_key, provider, result):
+        """Turn a background render into a widget, showing it if still wanted."""
+        self._render_tasks.pop(cache_key, None)
+        file_path = cache_key[0]
+        
+        # Widgets can only be created here, on the GUI thread
+        try:
+            preview_widget, metadata = provider.build_widget(*result)
+        except Exception as e:
+            if cache_key == self._pending_preview_key:
+                self._pending_preview_key = None
+                self.handle_preview_error(file_path, e)
+            return
+        
+        if preview_widget:
+            self._cache_preview(cache_key, preview_widget, metadata)
+        
+        # The user may have moved on (or it was a prefetch); then it's only cached
+        if cache_key == self._pending_preview_key:
+            self._pending_preview_key = None
+            self._show_preview(file_path, preview_widget, metadata)
+    
+    def _prefetch_neighbors(self):
+        """Build the preview of one uncached neighbour of the current item."""
+        if not self.iterator:
+            return
+        
+        # Widgets must be created on the GUI thread, so neighbours are built
+        # one per idle tick to keep any single stall short
+        current_index = self.iterator.get_current_index()
+        for neighbor_index in (current_index + 1, current_index - 1):
+            if not 0 <= neighbor_index < len(self.iterator.items):
+                continue
+            
+            neighbor_path = self.iterator.items[neighbor_index]
+            try:
+                file_stat = os.stat(neighbor_path)
+            except OSError:
+                continue
+            
+            cache_key = (neighbor_path, file_stat.st_mtime_ns, file_stat.st_size)
+            if cache_key in self._preview_cache or cache_key in self._render_tasks:
+                continue
+            
+            try:
+                provider = PreviewProviderManager.get_preview_provider(neighbor_path, file_stat)
+                if isinstance(provider, _BACKGROUND_PROVIDERS):
+                    # Cached by _on_preview_rendered once the pool is done
+                    self._start_preview_render(cache_key, provider)
+                    self._prefetch_timer.start(PREFETCH_DELAY_MS)
+                    return
+                preview_widget, metadata = provider.get_preview()
+            except Exception:
+                continue  # It will be reported if the user navigates there
+            
+            if preview_widget:
+                self._cache_preview(cache_key, preview_widget, metadata)
+            self._prefetch_timer.start(PREFETCH_DELAY_MS)
+            return
+    
+    def _set_preview_widget(self, widget: QWidget):
+        """Show a widget in the preview area by switching the stack to it."""
+        if self.preview_stack.indexOf(widget) == -1:
+            self.preview_stack.addWidget(widget)
+        previous = self.preview_stack.currentWidget()
+        self.preview_stack.setCurrentWidget(widget)
+        self.preview_stack.updateGeometry()
+        
+        # Cached previews and the default label stay in the stack, anything
+        # else (error labels, evicted previews) is discarded once hidden
+        if (previous is not None and previous is not widget
+                and previous is not self.default_preview and previous is not self.loading_preview
+                and not any(previous is cached_widget for cached_widget, _ in self._preview_cache.values())):
+            self._discard_preview_widget(previous)
+    
+    def _discard_preview_widget(self, widget: QWidget):
+        """Remove a preview widget from the stack and schedule its deletion."""
+        self.preview_stack.removeWidget(widget)
+        widget.deleteLater()
+    
+    def _cache_preview(self, cache_key, widget: QWidget, metadata: str):
+        """Remember a built preview, evicting the least recently used one."""
+        self._preview_cache[cache_key] = (widget, metadata)
+        while len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            _, (evicted_widget, _) = self._preview_cache.popitem(last=False)
+            if evicted_widget is not self.preview_stack.currentWidget():
+                self._discard_preview_widget(evicted_widget)
+    
+    def _drop_cached_previews(self, file_path: str):
+        """Forget cached previews for a path that is no longer on the desktop."""
+        for cache_key in [key for key in self._preview_cache if key[0] == file_path]:
+            cached_widget, _ = self._preview_cache.pop(cache_key)
+            if cached_widget is not self.preview_stack.currentWidget():
+                self._discard_preview_widget(cached_widget)
+    
     def show_default_preview(self):
         """Show default preview when no item is selected or preview fails."""
-        self.preview_scroll.setWidget(self.default_preview)
+        self._pending_preview_key = None
+        self._set_preview_widget(self.default_preview)
         self.metadata_label.setText("No metadata available")
         self.current_preview_widget = None
         self.current_metadata = ""
@@ -558,12 +996,12 @@ class DesktopCleanerGUI(QMainWindow):
     
     def handle_preview_error(self, file_path: str, error: Exception):
         """Handle preview loading errors gracefully."""
-        error_label = QLabel(f"Preview not available\n\nFile: {Path(file_path).name}\nError: {str(error)}")
+        error_label = QLabel(f"Preview not available\n\nFile: {os.path.basename(file_path)}\nError: {str(error)}")
         error_label.setAlignment(Qt.AlignCenter)
         error_label.setWordWrap(True)
         error_label.setStyleSheet("color: #666; font-style: italic;")
         
-        self.preview_scroll.setWidget(error_label)
+        self._set_preview_widget(error_label)
         self.metadata_label.setText(f"Error loading preview: {str(error)}")
         self.status_message.setText("Preview failed - using fallback")
     
@@ -576,13 +1014,17 @@ class DesktopCleanerGUI(QMainWindow):
         QMessageBox.critical(self, "Error", message)
     
     def _save_current_iterator_state(self):
+        """Schedule saving the current iterator state to the persistence file."""
+        self._save_timer.start(SAVE_DEBOUNCE_MS)
+    
+    def _flush_iterator_state(self):
         """Saves the current state of the iterator to the persistence file."""
+        self._save_timer.stop()
         if self.iterator:
-            # Ensure index is valid before saving
-            self.iterator._ensure_valid_index()
             items = self.iterator.items
             current_index = self.iterator.get_current_index()
             self.persistence_manager.save_iterator_state(items, current_index)
+        self.persistence_manager.commit()
     
     def advance_to_next_item(self):
         """Advance to the next item without performing any action."""
@@ -592,24 +1034,30 @@ class DesktopCleanerGUI(QMainWindow):
         next_path = self.iterator.next()
         if next_path:
             self.update_ui()
-            self.load_current_preview()
+            self.schedule_preview_load()
             self._save_current_iterator_state()
             self.status_message.setText("Moved to next item")
         else:
             self.show_completion_dialog()
     
-    def remove_current_item_and_advance(self):
-        """Remove current item from iterator and advance to next."""
+    def remove_current_item_and_advance(self, file_path: Optional[str] = None):
+        """
+        Remove an item from iterator and advance to next.
+        
+        Args:
+            file_path: Item to remove; defaults to the current item. A file
+                operation may finish after the user has navigated elsewhere.
+        """
         if not self.iterator:
             return
         
-        # Remove current item from the iterator's items list
-        current_index = self.iterator.get_current_index()
-        if 0 <= current_index < len(self.iterator.items):
-            self.iterator.items.pop(current_index)
-            
-            # Ensure index remains valid after removal
-            self.iterator._ensure_valid_index()
+        # Remove the item from the iterator; it keeps its index in bounds
+        if file_path is None:
+            removed_path = self.iterator.remove_current()
+        else:
+            removed_path = file_path if self.iterator.remove_item(file_path) else None
+        if removed_path is not None:
+            self._drop_cached_previews(removed_path)
             
             # Update UI and load preview
             self.update_ui()
@@ -638,7 +1086,7 @@ class DesktopCleanerGUI(QMainWindow):
         next_path = self.iterator.next()
         if next_path:
             self.update_ui()
-            self.load_current_preview()
+            self.schedule_preview_load()
             self._save_current_iterator_state()
             self.status_message.setText("Moved to next item")
         else:
@@ -652,7 +1100,7 @@ class DesktopCleanerGUI(QMainWindow):
         prev_path = self.iterator.prev()
         if prev_path:
             self.update_ui()
-            self.load_current_preview()
+            self.schedule_preview_load()
             self._save_current_iterator_state()
             self.status_message.setText("Moved to previous item")
         else:
@@ -680,7 +1128,22 @@ class DesktopCleanerGUI(QMainWindow):
     
     def closeEvent(self, event):
         """Handle application close event."""
-        # State is now saved on each navigation action, so no need to save on close.
+        # Drop queued preview renders and wait out the ones already decoding
+        self._preview_pool.clear()
+        self._preview_pool.waitForDone()
+        # Don't tear down the window while the scan thread is still running
+        if self._scan_thread is not None:
+            self._scan_thread.quit()
+            self._scan_thread.wait()
+        # Let an in-flight move/trash finish and record it before closing
+        if self._file_operation is not None:
+            QThreadPool.globalInstance().waitForDone()
+            QApplication.processEvents()
+        # Write out a save that is still waiting on the debounce timer, along
+        # with anything else the persistence manager hasn't committed yet
+        if self._save_timer.isActive():
+            self._flush_iterator_state()
+        self.persistence_manager.commit()
         event.accept()
     
     def show_state_summary(self):
@@ -691,6 +1154,7 @@ class DesktopCleanerGUI(QMainWindow):
         message = f"""Desktop Cleaner State Summary:
 
 Sessions run: {session_count}
+Items left on desktop: {summary['left']}
 Items moved to folders: {summary['moved']}
 Items moved to trash: {summary['trashed']}
 Total items handled: {sum(summary.values())}
@@ -773,14 +1237,11 @@ State file location: {self.persistence_manager.state_file_path}"""
 def main():
     """Main application entry point."""
     # Set Qt environment variables to reduce font warnings
-    import os
     os.environ['QT_LOGGING_RULES'] = 'qt.qpa.fonts.debug=false'
     
     app = QApplication(sys.argv)
     
     # Configure Qt font settings to avoid SF Pro Display warning
-    from PyQt5.QtGui import QFontDatabase
-    
     # Set font substitutions to prevent Qt from trying to use SF Pro Display
     QFont.insertSubstitution("SF Pro Display", "Helvetica")
     QFont.insertSubstitution(".SF NS Text", "Helvetica")
@@ -5,25 +5,103 @@ Handles saving and loading of application state, including which items have been
 and what actions were taken on them.
 """
 
+import os
 import json
 import hashlib
+import atexit
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, FrozenSet, Iterator
 from datetime import datetime
 
+try:
+    import orjson  # Faster JSON encode/decode, used when installed
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, compact unless indent is set."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes (orjson's decode error subclasses json's)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write(file_path: Path, data: bytes) -> None:
+    """
+    Write data to file_path so that readers see either the old or new contents.
+    
+    The data goes to a sibling temp file that is fsynced and then swapped into
+    place, so a crash mid-write never leaves a truncated or empty file.
+    """
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except OSError:
+        # Don't leave a half-written temp file behind
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _items_hash(items: List[str]) -> str:
+    """Short digest identifying an ordered list of item paths."""
+    return hashlib.blake2b('\0'.join(items).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _iterator_state(items: List[str], current_index: int) -> Dict[str, Any]:
+    """Build the persisted iterator state for a list of items and a position."""
+    return {
+        "items_hash": _items_hash(items),
+        "count": len(items),
+        "current_index": current_index,
+        "current_item": items[current_index] if 0 <= current_index < len(items) else None,
+    }
+
+
+# Layout version of the state file; see _upgrade_state for older layouts
+STATE_VERSION = "1.1"
+
+# Actions recorded for handled items, each with a running count in the state
+ACTION_TYPES = ("moved", "trashed", "left")
+
 
 class PersistenceManager:
     """Manages persistence of desktop cleaner state and handled items."""
     
-    def __init__(self, state_file: str = "desktop_cleaner_state.json"):
+    def __init__(self, state_file: str = "desktop_cleaner_state.json", autosave: bool = True):
         """
         Initialize the persistence manager.
         
         Args:
             state_file: Name of the state file (stored in user's home directory)
+            autosave: Write routine updates (handled items, iterator state,
+                session count) immediately. When False they only mark the
+                state dirty and are written by commit(), which also runs at exit
         """
         self.state_file_path = Path.home() / state_file
         self.state = self._load_state()
+        self.autosave = autosave
+        self._dirty = False  # Unsaved changes waiting for commit()
+        if not autosave:
+            atexit.register(self.commit)
+        # Cached result of get_left_paths, reset whenever handled items change
+        self._left_paths: Optional[FrozenSet[str]] = None
     
     def _load_state(self) -> Dict[str, Any]:
         """Load state from the JSON file."""
@@ -31,45 +109,75 @@ class PersistenceManager:
             return self._get_default_state()
         
         try:
-            with open(self.state_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.state_file_path, 'rb') as f:
+                state = _loads(f.read())
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load state file: {e}")
             return self._get_default_state()
+        
+        self._upgrade_state(state)
+        return state
+    
+    def _upgrade_state(self, state: Dict[str, Any]) -> None:
+        """Bring state saved by older versions up to the current layout."""
+        # Version 1.0 keyed handled items by the SHA-256 of their path; the
+        # path itself is stored in each record, so re-key by that
+        if state.get("version", "1.0") == "1.0":
+            legacy_items = sorted(state.get("handled_items", {}).values(),
+                                  key=lambda item_info: item_info.get("timestamp", ""))
+            state["handled_items"] = {
+                item_info["original_path"]: item_info
+                for item_info in legacy_items
+                if "original_path" in item_info
+            }
+            state["version"] = STATE_VERSION
+        
+        # The iterator state used to hold the whole item list
+        iterator_state = state.get("iterator_state", {})
+        if "items" in iterator_state:
+            state["iterator_state"] = _iterator_state(iterator_state["items"],
+                                                      iterator_state.get("current_index", 0))
+        
+        # Back-fill the action counters for state saved before they existed
+        if "action_counts" not in state:
+            counts = {action: 0 for action in ACTION_TYPES}
+            for item_info in state.get("handled_items", {}).values():
+                action = item_info.get("action", "unknown")
+                if action in counts:
+                    counts[action] += 1
+            state["action_counts"] = counts
     
     def _get_default_state(self) -> Dict[str, Any]:
         """Get the default state structure."""
         return {
-            "version": "1.0",
+            "version": STATE_VERSION,
             "last_updated": None,
             "session_count": 0,
-            "handled_items": {},  # path_hash -> action_info
-            "iterator_state": {
-                "items": [],
-                "current_index": 0
-            }
+            "handled_items": {},  # original path -> action_info
+            "action_counts": {action: 0 for action in ACTION_TYPES},
+            "iterator_state": _iterator_state([], 0)
         }
     
     def save_state(self) -> None:
         """Save the current state to the JSON file."""
         try:
             self.state["last_updated"] = datetime.now().isoformat()
-            with open(self.state_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2)
+            _atomic_write(self.state_file_path, _dumps(self.state))
+            self._dirty = False
         except IOError as e:
             print(f"Warning: Could not save state file: {e}")
     
-    def get_path_hash(self, file_path: str) -> str:
-        """
-        Generate a hash for a file path to use as a key.
-        
-        Args:
-            file_path: The file path to hash
-            
-        Returns:
-            SHA-256 hash of the file path
-        """
-        return hashlib.sha256(file_path.encode('utf-8')).hexdigest()
+    def _schedule_save(self) -> None:
+        """Save now, or leave it to commit() when autosave is off."""
+        if self.autosave:
+            self.save_state()
+        else:
+            self._dirty = True
+    
+    def commit(self) -> None:
+        """Write the state file if there are unsaved changes."""
+        if self._dirty:
+            self.save_state()
     
     def mark_item_handled(self, file_path: str, action: str, destination: Optional[str] = None) -> None:
         """
@@ -77,20 +185,30 @@ class PersistenceManager:
         
         Args:
             file_path: Path to the file that was handled
-            action: Action taken ("moved", "trashed")
+            action: Action taken ("moved", "trashed", "left")
             destination: Destination path if the item was moved
         """
-        path_hash = self.get_path_hash(file_path)
+        # Keep the per-action counters in step, including when an item that
+        # came back to the desktop is handled a second time
+        counts = self.state["action_counts"]
+        previous = self.state["handled_items"].get(file_path)
+        if previous is not None and previous.get("action") in counts:
+            counts[previous["action"]] -= 1
+        if action in counts:
+            counts[action] += 1
         
-        self.state["handled_items"][path_hash] = {
+        # Re-insert rather than overwrite so the dict stays in handling order
+        self.state["handled_items"].pop(file_path, None)
+        self.state["handled_items"][file_path] = {
             "original_path": file_path,
             "action": action,
             "destination": destination,
             "timestamp": datetime.now().isoformat(),
-            "filename": Path(file_path).name
+            "filename": os.path.basename(file_path)
         }
+        self._left_paths = None
         
-        self.save_state()
+        self._schedule_save()
     
     def is_item_handled(self, file_path: str) -> bool:
         """
@@ -102,8 +220,7 @@ class PersistenceManager:
         Returns:
             True if the item has been handled, False otherwise
         """
-        path_hash = self.get_path_hash(file_path)
-        return path_hash in self.state["handled_items"]
+        return file_path in self.state["handled_items"]
     
     def get_item_action(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
@@ -115,8 +232,7 @@ class PersistenceManager:
         Returns:
             Dictionary with action information, or None if not handled
         """
-        path_hash = self.get_path_hash(file_path)
-        return self.state["handled_items"].get(path_hash)
+        return self.state["handled_items"].get(file_path)
     
     def get_handled_items_summary(self) -> Dict[str, int]:
         """
@@ -125,14 +241,7 @@ class PersistenceManager:
         Returns:
             Dictionary with counts for each action type
         """
-        summary = {"moved": 0, "trashed": 0}
-        
-        for item_info in self.state["handled_items"].values():
-            action = item_info.get("action", "unknown")
-            if action in summary:
-                summary[action] += 1
-        
-        return summary
+        return dict(self.state["action_counts"])
     
     def get_handled_items_list(self) -> List[Dict[str, Any]]:
         """
@@ -143,6 +252,18 @@ class PersistenceManager:
         """
         return list(self.state["handled_items"].values())
     
+    def iter_handled_items(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over handled items in the order they were handled.
+        
+        Items are kept in handling order as they are recorded, so no sort or
+        copy of the whole collection is needed.
+        
+        Returns:
+            Iterator of dictionaries containing item information, oldest first
+        """
+        return iter(self.state["handled_items"].values())
+    
     def filter_unhandled_items(self, current_desktop_items: List[str]) -> List[str]:
         """
         Filters out items that should not be presented to the user again.
@@ -157,65 +278,100 @@ class PersistenceManager:
         Returns:
             List of file paths that should be presented to the user.
         """
-        unhandled_items = []
-        for item_path in current_desktop_items:
-            path_hash = self.get_path_hash(item_path)
-            handled_info = self.state["handled_items"].get(path_hash)
+        # Nothing has ever been handled (e.g. a fresh install), so nothing to filter
+        if not self.state["handled_items"]:
+            return list(current_desktop_items)
 
-            if handled_info:
-                action = handled_info.get("action")
-                if action in ["moved", "trashed"]:
-                    # If it was moved/trashed, and it's now back on the desktop,
-                    # it should be considered unhandled again.
-                    # We don't filter it out.
-                    pass # It's back on desktop, so it's unhandled.
-            
-            # If not handled, or if handled by move/trash and now back on desktop
-            unhandled_items.append(item_path)
-            
-        return unhandled_items
+        # Moved/trashed items can only be in this list if they came back to the
+        # desktop, so only items that were explicitly left get filtered out
+        left_paths = self.get_left_paths()
+        return [item_path for item_path in current_desktop_items if item_path not in left_paths]
+    
+    def get_left_paths(self) -> FrozenSet[str]:
+        """
+        Get the paths of all items that were explicitly left on the desktop.
+        
+        Returns:
+            Frozen set of original paths for items with the 'left' action
+        """
+        if self._left_paths is None:
+            self._left_paths = frozenset(
+                item_info["original_path"]
+                for item_info in self.state["handled_items"].values()
+                if item_info.get("action") == "left" and "original_path" in item_info
+            )
+        return self._left_paths
     
     def save_iterator_state(self, items: List[str], current_index: int) -> None:
         """
         Save the iterator state.
         
+        Only a digest of the item list is kept, not the list itself, so the
+        state stays the same size however many items are on the desktop.
+        
         Args:
             items: List of items in the iterator
             current_index: Current index position
         """
-        self.state["iterator_state"] = {
-            "items": items,
-            "current_index": current_index
-        }
-        self.save_state()
+        self.state["iterator_state"] = _iterator_state(items, current_index)
+        self._schedule_save()
     
-    def load_iterator_state(self) -> tuple[List[str], int]:
+    def load_iterator_state(self) -> Dict[str, Any]:
         """
         Load the iterator state.
         
         Returns:
-            Tuple of (items list, current index)
+            Dictionary with the saved "current_index", "current_item" (path or
+            None), item "count" and "items_hash" digest of the item list
         """
         iterator_state = self.state.get("iterator_state", {})
-        items = iterator_state.get("items", [])
-        current_index = iterator_state.get("current_index", 0)
+        return {
+            "items_hash": iterator_state.get("items_hash"),
+            "count": iterator_state.get("count", 0),
+            "current_index": iterator_state.get("current_index", 0),
+            "current_item": iterator_state.get("current_item"),
+        }
+    
+    def iterator_items_match(self, items: List[str]) -> bool:
+        """
+        Check whether items is the same list the iterator state was saved for.
         
-        return items, current_index
+        Args:
+            items: Freshly scanned list of items
+            
+        Returns:
+            True if the saved position can be resumed as-is
+        """
+        iterator_state = self.state.get("iterator_state", {})
+        return (iterator_state.get("count") == len(items)
+                and iterator_state.get("items_hash") == _items_hash(items))
     
     def clear_state(self) -> None:
         """Clear all state data (reset to defaults)."""
         self.state = self._get_default_state()
+        self._left_paths = None
         self.save_state()
     
     def clear_handled_items(self) -> None:
         """Clear only the handled items data, keeping other state."""
         self.state["handled_items"] = {}
+        self.state["action_counts"] = {action: 0 for action in ACTION_TYPES}
+        self._left_paths = None
+        self.save_state()
+    
+    def clear_iterator_state(self) -> None:
+        """Clear only the saved iterator position, keeping other state."""
+        cleared = _iterator_state([], 0)
+        # Nothing to write if there is no position saved
+        if self.state.get("iterator_state") == cleared:
+            return
+        self.state["iterator_state"] = cleared
         self.save_state()
     
     def increment_session_count(self) -> None:
         """Increment the session count."""
         self.state["session_count"] = self.state.get("session_count", 0) + 1
-        self.save_state()
+        self._schedule_save()
     
     def get_session_count(self) -> int:
         """Get the number of sessions."""
@@ -232,6 +388,7 @@ class PersistenceManager:
             if self.state_file_path.exists():
                 self.state_file_path.unlink()
             self.state = self._get_default_state()
+            self._left_paths = None
             return True
         except OSError as e:
             print(f"Warning: Could not delete state file: {e}")
@@ -248,9 +405,7 @@ class PersistenceManager:
             True if export successful, False otherwise
         """
         try:
-            export_file = Path(export_path)
-            with open(export_file, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2)
+            _atomic_write(Path(export_path), _dumps(self.state, indent=True))
             return True
         except IOError as e:
             print(f"Warning: Could not export state: {e}")
@@ -271,13 +426,15 @@ class PersistenceManager:
             if not import_file.exists():
                 return False
             
-            with open(import_file, 'r', encoding='utf-8') as f:
-                imported_state = json.load(f)
+            with open(import_file, 'rb') as f:
+                imported_state = _loads(f.read())
             
             # Validate the imported state has required keys
             required_keys = ["handled_items", "iterator_state"]
             if all(key in imported_state for key in required_keys):
+                self._upgrade_state(imported_state)
                 self.state = imported_state
+                self._left_paths = None
                 self.save_state()
                 return True
             else:
@@ -1,10 +1,35 @@
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QFileIconProvider, QDialog, QScrollArea, QPushButton, QHBoxLayout
-from PyQt5.QtGui import QPixmap, QFont, QIcon, QCursor
-from PyQt5.QtCore import QFileInfo, Qt, pyqtSignal
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QFont, QIcon, QCursor
+from PyQt5.QtCore import QFileInfo, Qt, pyqtSignal, QStandardPaths
 from PyQt5.QtSvg import QSvgWidget
 import os
+import io
+import time
+import hashlib
+import codecs
+import importlib.util
+import threading
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+
+@lru_cache(maxsize=None)
+def cached_font(point_size, bold=False, family=None):
+    """
+    Get a shared QFont for the given style.
+    
+    setFont copies the font, so one instance per style can be reused by every
+    widget instead of building a new QFont each time a preview is created.
+    Fonts are created on first use because a QFont needs a running QApplication.
+    """
+    font = QFont()
+    if family:
+        font.setFamily(family)
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
 
 
 class ClickablePreviewLabel(QLabel):
@@ -59,108 +84,331 @@ class ClickablePreviewLabel(QLabel):
         
         dialog.exec_()
 
-try:
-    import fitz  # PyMuPDF
-    HAS_PYMUPDF = True
-except ImportError:
-    HAS_PYMUPDF = False
+
+# PyMuPDF is slow to import, so only check that it is installed here and load
+# it the first time a PDF is actually previewed
+HAS_PYMUPDF = importlib.util.find_spec("fitz") is not None
+_fitz = None
+
+# Longest side, in pixels, PDF pages are rendered at; matches the large preview
+_PDF_RENDER_SIZE = 600
+_FITZ_LOCK = threading.Lock()
+
+
+def _load_fitz():
+    """Import PyMuPDF on first use and return the module, or None if unavailable."""
+    global _fitz
+    if _fitz is None:
+        try:
+            import fitz  # PyMuPDF
+            _fitz = fitz
+        except ImportError:
+            _fitz = False
+    return _fitz or None
+
+
+# Rendered PDF pages are kept on disk for this long after they were last used
+_THUMBNAIL_MAX_AGE = 30 * 24 * 60 * 60
+# Least recently used pages are dropped once the cache grows past this size
+_THUMBNAIL_MAX_BYTES = 64 * 1024 * 1024
+_thumbnail_dir = None  # '' once the cache turned out to be unusable
+_thumbnail_dir_lock = threading.Lock()
+
+
+def _thumbnail_cache_dir():
+    """Get the thumbnail cache directory, creating and pruning it on first use."""
+    global _thumbnail_dir
+    with _thumbnail_dir_lock:
+        if _thumbnail_dir is None:
+            _thumbnail_dir = ''
+            base_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+            if base_dir:
+                cache_dir = os.path.join(base_dir, "thumbnails")
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    _prune_thumbnails(cache_dir)
+                    _thumbnail_dir = cache_dir
+                except OSError as e:
+                    print(f"Warning: Could not use thumbnail cache: {e}")
+    return _thumbnail_dir or None
+
+
+def _prune_thumbnails(cache_dir):
+    """Delete cached thumbnails that are old or don't fit in the size limit."""
+    cutoff = time.time() - _THUMBNAIL_MAX_AGE
+    kept = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            try:
+                entry_stat = entry.stat()
+                if entry_stat.st_mtime < cutoff:
+                    os.unlink(entry.path)
+                else:
+                    kept.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+            except OSError:
+                pass
+    
+    # Thumbnails are touched when used, so the oldest mtime goes first
+    total_size = sum(size for _, size, _ in kept)
+    kept.sort()
+    for _, size, path in kept:
+        if total_size <= _THUMBNAIL_MAX_BYTES:
+            break
+        try:
+            os.unlink(path)
+            total_size -= size
+        except OSError:
+            pass
+
+
+def _thumbnail_key(file_path):
+    """File name prefix shared by every cached version of file_path."""
+    return hashlib.sha1(file_path.encode('utf-8')).hexdigest()[:16]
+
+
+def _thumbnail_path(file_path, file_info):
+    """Cache file for this version of file_path, or None if there is no cache."""
+    cache_dir = _thumbnail_cache_dir()
+    if cache_dir is None:
+        return None
+    # Any edit changes mtime/size, so stale renders are never picked up
+    key = _thumbnail_key(file_path)
+    return os.path.join(cache_dir, f"{key}_{file_info.st_mtime_ns}_{file_info.st_size}.png")
+
+
+def _save_thumbnail(image, thumbnail_path):
+    """Write a rendered page to the cache; failures only cost a re-render later."""
+    tmp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+    try:
+        if image.save(tmp_path, "PNG"):
+            os.replace(tmp_path, thumbnail_path)
+        else:
+            os.unlink(tmp_path)
+    except OSError:
+        pass
+
+
+def _touch(path):
+    """Mark a cached thumbnail as recently used so pruning keeps it."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def remove_thumbnails(file_path):
+    """
+    Delete every cached thumbnail of a file.
+    
+    Called once a file has been moved or trashed, so a rendered page of a
+    discarded document doesn't stay behind in the cache.
+    
+    Args:
+        file_path: Path of the file as it was previewed
+    """
+    cache_dir = _thumbnail_cache_dir()
+    if cache_dir is None:
+        return
+    prefix = f"{_thumbnail_key(file_path)}_"
+    try:
+        with os.scandir(cache_dir) as it:
+            stale_paths = [entry.path for entry in it if entry.name.startswith(prefix)]
+    except OSError:
+        return
+    for path in stale_paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+# Longest side, in pixels, images are decoded at; matches the large preview
+_IMAGE_DECODE_SIZE = 600
+
+
+def _file_stat(path, stat_result=None):
+    """
+    Return the caller-supplied stat result, or stat the path if there is none.
+    
+    Providers take an optional stat_result so a caller that has already
+    stat'ed the file (the GUI does, to key its preview cache) saves a syscall.
+    """
+    return stat_result if stat_result is not None else os.stat(path)
+
+
+def _image_preview_widget(file_path, image):
+    """Build the clickable preview label for a rendered QImage (GUI thread only)."""
+    pixmap = QPixmap.fromImage(image)
+    widget = ClickablePreviewLabel()
+    scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    widget.setPixmap(scaled_pixmap)
+    widget.setAlignment(Qt.AlignCenter)
+    widget.setToolTip("Click to view larger preview")
+    widget.setStyleSheet("border: 1px solid #ccc; padding: 5px; background-color: white;")
+    
+    # Store original image for larger preview
+    widget.original_image = pixmap
+    widget.file_path = file_path
+    return widget
+
+
+def _message_widget(text):
+    """Build a centered label shown in place of a preview."""
+    widget = QLabel(text)
+    widget.setAlignment(Qt.AlignCenter)
+    return widget
+
 
 class ImagePreview:
-    def __init__(self, file_path):
+    """
+    Image preview, split so the decode can run off the GUI thread:
+    render() only touches QImage and is thread-safe, build_widget() creates
+    the widgets and must run on the GUI thread.
+    """
+    
+    def __init__(self, file_path, stat_result=None):
         self.file_path = file_path
+        self.stat_result = stat_result
 
-    def get_preview(self):
+    def render(self):
+        """
+        Decode the image and gather its metadata.
+        
+        Returns:
+            Tuple of (QImage or None, metadata, error text shown when there is no image)
+        """
         try:
-            pixmap = QPixmap(self.file_path)
-            if pixmap.isNull():
-                widget = QLabel("Image preview not available")
-                widget.setAlignment(Qt.AlignCenter)
-                return widget, "Failed to load image"
-            
-            # Create a clickable label for the image preview
-            widget = ClickablePreviewLabel()
-            scaled_pixmap = pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            widget.setPixmap(scaled_pixmap)
-            widget.setAlignment(Qt.AlignCenter)
-            widget.setToolTip("Click to view larger preview")
-            widget.setStyleSheet("border: 1px solid #ccc; padding: 5px; background-color: white;")
-
-            # Store original image for larger preview
-            widget.original_image = pixmap
-            widget.file_path = self.file_path
+            reader = QImageReader(self.file_path)
+            reader.setAutoTransform(True)
+            original_size = reader.size()
+            # Let the decoder scale down while decoding (e.g. JPEG DCT scaling)
+            # instead of decoding every pixel of a large photo and then shrinking;
+            # the largest size shown is the enlarged view
+            if (original_size.isValid()
+                    and max(original_size.width(), original_size.height()) > _IMAGE_DECODE_SIZE):
+                reader.setScaledSize(original_size.scaled(_IMAGE_DECODE_SIZE, _IMAGE_DECODE_SIZE, Qt.KeepAspectRatio))
+            image = reader.read()
+            if image.isNull():
+                return None, "Failed to load image", "Image preview not available"
+            if not original_size.isValid():
+                original_size = image.size()
             
             # Get image metadata
-            file_info = Path(self.file_path).stat()
+            file_info = _file_stat(self.file_path, self.stat_result)
             size_mb = file_info.st_size / (1024 * 1024)
             modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            metadata = f"Image: {pixmap.width()}x{pixmap.height()}\nSize: {size_mb:.2f} MB\nModified: {modified}"
+            metadata = f"Image: {original_size.width()}x{original_size.height()}\nSize: {size_mb:.2f} MB\nModified: {modified}"
             
-            return widget, metadata
+            return image, metadata, None
         except Exception as e:
-            widget = QLabel(f"Error loading image: {str(e)}")
-            widget.setAlignment(Qt.AlignCenter)
-            return widget, f"Error: {str(e)}"
+            return None, f"Error: {str(e)}", f"Error loading image: {str(e)}"
+
+    def build_widget(self, image, metadata, error_text):
+        """Create the preview widget from the result of render()."""
+        if image is None:
+            return _message_widget(error_text), metadata
+        return _image_preview_widget(self.file_path, image), metadata
+
+    def get_preview(self):
+        return self.build_widget(*self.render())
 
 class PDFPreview:
-    def __init__(self, file_path):
+    """First-page PDF preview, split into render() and build_widget() like ImagePreview."""
+    
+    def __init__(self, file_path, stat_result=None):
         self.file_path = file_path
+        self.stat_result = stat_result
 
-    def get_preview(self):
-        if not HAS_PYMUPDF:
-            widget = QLabel("PDF preview not available\nPyMuPDF not installed")
-            widget.setAlignment(Qt.AlignCenter)
-            return widget, "PyMuPDF not installed"
+    def render(self):
+        """
+        Rasterize the first page and gather the document's metadata.
         
+        Returns:
+            Tuple of (QImage or None, metadata, error text shown when there is no image)
+        """
         try:
-            doc = fitz.open(self.file_path)
-            if len(doc) == 0:
-                widget = QLabel("PDF is empty")
-                widget.setAlignment(Qt.AlignCenter)
-                return widget, "Empty PDF file"
-            
-            page = doc[0]
-            pix = page.get_pixmap()
-            image = QPixmap()
-            image.loadFromData(pix.tobytes())
+            file_info = _file_stat(self.file_path, self.stat_result)
+        except OSError as e:
+            return None, f"Error: {str(e)}", f"Error loading PDF: {str(e)}"
+        
+        # An unchanged PDF rendered in an earlier session is loaded from disk
+        # without opening (or even importing) PyMuPDF
+        thumbnail_path = _thumbnail_path(self.file_path, file_info)
+        if thumbnail_path:
+            image = QImage(thumbnail_path)
+            page_count = image.text("pages")
+            if not image.isNull() and page_count.isdigit():
+                _touch(thumbnail_path)
+                return image, self._metadata(int(page_count), file_info), None
+        
+        fitz = _load_fitz() if HAS_PYMUPDF else None
+        if fitz is None:
+            return None, "PyMuPDF not installed", "PDF preview not available\nPyMuPDF not installed"
+        
+        try:
+            # PyMuPDF isn't thread-safe, so only one pool thread uses it at a time
+            with _FITZ_LOCK:
+                doc = fitz.open(self.file_path)
+                try:
+                    page_count = len(doc)
+                    if page_count == 0:
+                        return None, "Empty PDF file", "PDF is empty"
+                    
+                    # Rasterize straight at the largest size shown (the enlarged view)
+                    # instead of at 72 dpi, and hand the raw RGB samples to Qt rather
+                    # than round-tripping through PNG
+                    page = doc[0]
+                    zoom = _PDF_RENDER_SIZE / max(page.rect.width, page.rect.height, 1)
+                    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csRGB, alpha=False)
+                    # copy() detaches the image from pix's buffer, which is freed with pix
+                    image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888).copy()
+                finally:
+                    doc.close()
             
             if image.isNull():
-                widget = QLabel("PDF preview not available")
-                widget.setAlignment(Qt.AlignCenter)
-                return widget, "Failed to render PDF page"
+                return None, "Failed to render PDF page", "PDF preview not available"
             
-            # Create larger preview (doubled size)
-            scaled_image = image.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            widget = ClickablePreviewLabel()
-            widget.setPixmap(scaled_image)
-            widget.setAlignment(Qt.AlignCenter)
-            widget.setToolTip("Click to view larger preview")
-            widget.setStyleSheet("border: 1px solid #ccc; padding: 5px; background-color: white;")
+            if thumbnail_path:
+                image.setText("pages", str(page_count))
+                _save_thumbnail(image, thumbnail_path)
             
-            # Store original image for larger preview
-            widget.original_image = image
-            widget.file_path = self.file_path
-            
-            # Get PDF metadata
-            file_info = Path(self.file_path).stat()
-            size_mb = file_info.st_size / (1024 * 1024)
-            modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            metadata = f"PDF: {len(doc)} pages\nSize: {size_mb:.2f} MB\nModified: {modified}"
-            
-            doc.close()
-            return widget, metadata
+            return image, self._metadata(page_count, file_info), None
             
         except Exception as e:
-            widget = QLabel(f"Error loading PDF: {str(e)}")
-            widget.setAlignment(Qt.AlignCenter)
-            return widget, f"Error: {str(e)}"
+            return None, f"Error: {str(e)}", f"Error loading PDF: {str(e)}"
+
+    def _metadata(self, page_count, file_info):
+        """Format the metadata text for a PDF."""
+        size_mb = file_info.st_size / (1024 * 1024)
+        modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+        return f"PDF: {page_count} pages\nSize: {size_mb:.2f} MB\nModified: {modified}"
+
+    def build_widget(self, image, metadata, error_text):
+        """Create the preview widget from the result of render()."""
+        if image is None:
+            return _message_widget(error_text), metadata
+        return _image_preview_widget(self.file_path, image), metadata
+
+    def get_preview(self):
+        return self.build_widget(*self.render())
+
+# Bytes read from the start of a text file; enough for the lines shown
+_TEXT_HEAD_BYTES = 8192
 
 class TextPreview:
-    def __init__(self, file_path, lines=10):
+    def __init__(self, file_path, lines=10, stat_result=None):
         self.file_path = file_path
+        self.stat_result = stat_result
         self.lines = lines
 
     def get_preview(self):
         try:
+            # Only the start of the file is shown, so read a bounded head once
+            # rather than the whole file per candidate encoding
+            with open(self.file_path, 'rb') as file:
+                head = file.read(_TEXT_HEAD_BYTES)
+                at_eof = not file.read(1)
+            
             # Try different encodings
             encodings = ['utf-8', 'latin-1', 'cp1252']
             content = None
@@ -168,13 +416,15 @@ class TextPreview:
             
             for encoding in encodings:
                 try:
-                    with open(self.file_path, 'r', encoding=encoding) as file:
-                        lines = file.readlines()[:self.lines]
-                        content = ''.join(lines)
-                        encoding_used = encoding
-                        break
+                    # An incremental decoder tolerates a multi-byte character
+                    # cut off at the end of the head
+                    text = codecs.getincrementaldecoder(encoding)().decode(head, final=at_eof)
                 except UnicodeDecodeError:
                     continue
+                # newline=None translates \r\n like reading in text mode did
+                content = ''.join(islice(io.StringIO(text, newline=None), self.lines))
+                encoding_used = encoding
+                break
             
             if content is None:
                 widget = QLabel("Cannot read text file (encoding issues)")
@@ -186,15 +436,12 @@ class TextPreview:
                 content = content[:1000] + "..."
             
             widget = QLabel(content)
-            text_font = QFont()
-            text_font.setPointSize(9)
-            text_font.setFamily("Monaco")  # Use Monaco, a monospace font available on macOS
-            widget.setFont(text_font)
+            widget.setFont(cached_font(9, family="Monaco"))  # Use Monaco, a monospace font available on macOS
             widget.setWordWrap(True)
             widget.setAlignment(Qt.AlignTop | Qt.AlignLeft)
             
             # Get file metadata
-            file_info = Path(self.file_path).stat()
+            file_info = _file_stat(self.file_path, self.stat_result)
             size_kb = file_info.st_size / 1024
             modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
             metadata = f"Text file ({encoding_used})\nSize: {size_kb:.1f} KB\nModified: {modified}"
@@ -207,12 +454,16 @@ class TextPreview:
             return widget, f"Error: {str(e)}"
 
 class DirectoryPreview:
-    def __init__(self, dir_path):
+    def __init__(self, dir_path, stat_result=None):
         self.dir_path = dir_path
+        self.stat_result = stat_result
 
     def get_preview(self):
         try:
-            entries = os.listdir(self.dir_path)
+            # One scandir pass; DirEntry.is_dir() reuses the type readdir
+            # already returned instead of stat()ing every entry
+            with os.scandir(self.dir_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
             
             # Create a widget with folder icon and file list
             widget = QWidget()
@@ -233,10 +484,7 @@ class DirectoryPreview:
             # Directory name
             dir_name = os.path.basename(self.dir_path) or "Desktop"
             name_label = QLabel(dir_name)
-            name_font = QFont()
-            name_font.setPointSize(14)
-            name_font.setBold(True)
-            name_label.setFont(name_font)
+            name_label.setFont(cached_font(14, bold=True))
             name_label.setAlignment(Qt.AlignCenter)
             name_label.setStyleSheet("color: #333; margin-bottom: 5px;")
             layout.addWidget(name_label)
@@ -250,26 +498,22 @@ class DirectoryPreview:
             
             # Item count
             count_label = QLabel(f"{len(entries)} items")
-            count_font = QFont()
-            count_font.setPointSize(11)
-            count_label.setFont(count_font)
+            count_label.setFont(cached_font(11))
             count_label.setAlignment(Qt.AlignCenter)
             count_label.setStyleSheet("color: #666; margin-bottom: 10px;")
             layout.addWidget(count_label)
             
-            # Sort and limit entries
-            entries.sort()
+            # Limit entries (already sorted by name)
             display_entries = entries[:20]  # Show fewer items for cleaner look
             
             # File list with modern styling
             if display_entries:
                 file_list_text = []
                 for entry in display_entries:
-                    entry_path = os.path.join(self.dir_path, entry)
-                    if os.path.isdir(entry_path):
-                        file_list_text.append(f"📁 {entry}")
+                    if entry.is_dir():
+                        file_list_text.append(f"📁 {entry.name}")
                     else:
-                        file_list_text.append(f"📄 {entry}")
+                        file_list_text.append(f"📄 {entry.name}")
                 
                 if len(entries) > 20:
                     file_list_text.append(f"\n⋯ and {len(entries) - 20} more items")
@@ -277,9 +521,7 @@ class DirectoryPreview:
                 content = '\n'.join(file_list_text)
                 
                 files_label = QLabel(content)
-                files_font = QFont()
-                files_font.setPointSize(10)
-                files_label.setFont(files_font)
+                files_label.setFont(cached_font(10))
                 files_label.setWordWrap(True)
                 files_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
                 files_label.setStyleSheet("""
@@ -296,7 +538,7 @@ class DirectoryPreview:
             layout.addStretch()
             
             # Get directory metadata
-            file_info = Path(self.dir_path).stat()
+            file_info = _file_stat(self.dir_path, self.stat_result)
             modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
             metadata = f"Directory: {len(entries)} items\nModified: {modified}"
             
@@ -314,8 +556,9 @@ class DirectoryPreview:
             return widget, f"Error: {str(e)}"
 
 class SvgPreview:
-    def __init__(self, file_path):
+    def __init__(self, file_path, stat_result=None):
         self.file_path = file_path
+        self.stat_result = stat_result
 
     def get_preview(self):
         try:
@@ -323,7 +566,7 @@ class SvgPreview:
             widget.setMinimumSize(200, 200)
             widget.setStyleSheet("border: 1px solid #ccc; padding: 5px; background-color: white;")
 
-            file_info = Path(self.file_path).stat()
+            file_info = _file_stat(self.file_path, self.stat_result)
             size_kb = file_info.st_size / 1024
             modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
             metadata = f"SVG Image\nSize: {size_kb:.1f} KB\nModified: {modified}"
@@ -335,8 +578,9 @@ class SvgPreview:
             return widget, f"Error: {str(e)}"
 
 class DocxPreview:
-    def __init__(self, file_path, lines=20):
+    def __init__(self, file_path, lines=20, stat_result=None):
         self.file_path = file_path
+        self.stat_result = stat_result
         self.lines = lines
 
     def get_preview(self):
@@ -349,14 +593,11 @@ class DocxPreview:
                 content = content[:1000] + "..."
 
             widget = QLabel(content)
-            text_font = QFont()
-            text_font.setPointSize(9)
-            text_font.setFamily("Helvetica")
-            widget.setFont(text_font)
+            widget.setFont(cached_font(9, family="Helvetica"))
             widget.setWordWrap(True)
             widget.setAlignment(Qt.AlignTop | Qt.AlignLeft)
 
-            file_info = Path(self.file_path).stat()
+            file_info = _file_stat(self.file_path, self.stat_result)
             size_kb = file_info.st_size / 1024
             modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
             metadata = f"Word Document\nSize: {size_kb:.1f} KB\nModified: {modified}"
@@ -368,8 +609,9 @@ class DocxPreview:
             return widget, f"Error: {str(e)}"
 
 class RtfPreview:
-    def __init__(self, file_path, lines=20):
+    def __init__(self, file_path, lines=20, stat_result=None):
         self.file_path = file_path
+        self.stat_result = stat_result
         self.lines = lines
 
     def get_preview(self):
@@ -385,14 +627,11 @@ class RtfPreview:
                 content = content[:1000] + "..."
 
             widget = QLabel(content)
-            text_font = QFont()
-            text_font.setPointSize(9)
-            text_font.setFamily("Helvetica")
-            widget.setFont(text_font)
+            widget.setFont(cached_font(9, family="Helvetica"))
             widget.setWordWrap(True)
             widget.setAlignment(Qt.AlignTop | Qt.AlignLeft)
 
-            file_info = Path(self.file_path).stat()
+            file_info = _file_stat(self.file_path, self.stat_result)
             size_kb = file_info.st_size / 1024
             modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
             metadata = f"RTF Document\nSize: {size_kb:.1f} KB\nModified: {modified}"
@@ -404,8 +643,9 @@ class RtfPreview:
             return widget, f"Error: {str(e)}"
 
 class XlsxPreview:
-    def __init__(self, file_path, rows=10, cols=5):
+    def __init__(self, file_path, rows=10, cols=5, stat_result=None):
         self.file_path = file_path
+        self.stat_result = stat_result
         self.rows = rows
         self.cols = cols
 
@@ -420,14 +660,11 @@ class XlsxPreview:
                 content += '\t'.join([str(cell.value or '') for cell in row]) + '\n'
 
             widget = QLabel(content)
-            text_font = QFont()
-            text_font.setPointSize(9)
-            text_font.setFamily("Monaco")
-            widget.setFont(text_font)
+            widget.setFont(cached_font(9, family="Monaco"))
             widget.setWordWrap(False)
             widget.setAlignment(Qt.AlignTop | Qt.AlignLeft)
 
-            file_info = Path(self.file_path).stat()
+            file_info = _file_stat(self.file_path, self.stat_result)
             size_kb = file_info.st_size / 1024
             modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
             metadata = f"Excel Spreadsheet\nSize: {size_kb:.1f} KB\nModified: {modified}"
@@ -438,10 +675,22 @@ class XlsxPreview:
             widget.setAlignment(Qt.AlignCenter)
             return widget, f"Error: {str(e)}"
 
+# (threshold, unit) pairs for _format_size, largest first
+_SIZE_UNITS = ((1 << 30, "GB"), (1 << 20, "MB"), (1 << 10, "KB"))
+
+
+def _format_size(size_bytes):
+    """Format a byte count with the largest unit it reaches, e.g. '1.5 MB'."""
+    for threshold, unit in _SIZE_UNITS:
+        if size_bytes >= threshold:
+            return f"{size_bytes / threshold:.1f} {unit}"
+    return f"{size_bytes} bytes"
+
 class GenericPreview:
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, stat_result=None):
         self.file_path = file_path
+        self.stat_result = stat_result
 
     def get_preview(self):
         try:
@@ -455,18 +704,11 @@ class GenericPreview:
             widget.setAlignment(Qt.AlignCenter)
             
             # Get file metadata
-            file_info = Path(self.file_path).stat()
+            file_info = _file_stat(self.file_path, self.stat_result)
             size_bytes = file_info.st_size
             
             # Format file size
-            if size_bytes < 1024:
-                size_str = f"{size_bytes} bytes"
-            elif size_bytes < 1024 * 1024:
-                size_str = f"{size_bytes / 1024:.1f} KB"
-            elif size_bytes < 1024 * 1024 * 1024:
-                size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
-            else:
-                size_str = f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+            size_str = _format_size(size_bytes)
             
             modified = datetime.fromtimestamp(file_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
             file_type = Path(self.file_path).suffix.upper() or "Unknown"
@@ -478,8 +720,6 @@ class GenericPreview:
         except Exception as e:
             widget = QLabel("?")
             widget.setAlignment(Qt.AlignCenter)
-            error_font = QFont()
-            error_font.setPointSize(24)
-            widget.setFont(error_font)
+            widget.setFont(cached_font(24))
             return widget, f"Error: {str(e)}"
 
@@ -5,55 +5,69 @@ Allows users to view, clear, export, and import their state data.
 """
 
 import argparse
-import json
+import os
 import sys
-from pathlib import Path
+from itertools import chain
 from persistence_manager import PersistenceManager
 
 
+# Number of handled items formatted before each write to stdout
+PRINT_BATCH_SIZE = 256
+
+# Header and counts block of the summary, written in one go
+SUMMARY_TEMPLATE = (
+    "=== Desktop Cleaner State Summary ===\n"
+    "Sessions run: {sessions}\n"
+    "Items left on desktop: {left}\n"
+    "Items moved to folders: {moved}\n"
+    "Items moved to trash: {trashed}\n"
+    "Total items handled: {total}\n"
+    "\n"
+)
+
+
 def print_summary(persistence_manager: PersistenceManager):
     """Print a summary of the current state."""
     summary = persistence_manager.get_handled_items_summary()
     session_count = persistence_manager.get_session_count()
     
-    print("=== Desktop Cleaner State Summary ===")
-    print(f"Sessions run: {session_count}")
-    print(f"Items left on desktop: {summary['left']}")
-    print(f"Items moved to folders: {summary['moved']}")
-    print(f"Items moved to trash: {summary['trashed']}")
-    print(f"Total items handled: {sum(summary.values())}")
-    print()
+    sys.stdout.write(SUMMARY_TEMPLATE.format(sessions=session_count, total=sum(summary.values()), **summary))
     
     # Show iterator state
-    items, current_index = persistence_manager.load_iterator_state()
-    if items:
-        print(f"Iterator state: {current_index + 1}/{len(items)} items")
-        print(f"Current item: {Path(items[current_index]).name if current_index < len(items) else 'N/A'}")
+    iterator_state = persistence_manager.load_iterator_state()
+    if iterator_state["count"]:
+        current_item = iterator_state["current_item"]
+        print(f"Iterator state: {iterator_state['current_index'] + 1}/{iterator_state['count']} items")
+        print(f"Current item: {os.path.basename(current_item) if current_item else 'N/A'}")
     else:
         print("No iterator state saved")
 
 
 def print_detailed_items(persistence_manager: PersistenceManager):
     """Print detailed information about all handled items."""
-    items = persistence_manager.get_handled_items_list()
+    # Items come back oldest first, so they can be printed as they are read
+    items = persistence_manager.iter_handled_items()
+    first_item = next(items, None)
     
-    if not items:
+    if first_item is None:
         print("No items have been handled yet.")
         return
     
     print("=== Handled Items Details ===")
     
-    # Sort by timestamp
-    items.sort(key=lambda x: x.get('timestamp', ''))
-    
-    for item in items:
-        print(f"File: {item.get('filename', 'Unknown')}")
-        print(f"  Action: {item.get('action', 'Unknown')}")
-        print(f"  Original path: {item.get('original_path', 'Unknown')}")
+    # Write in batches rather than one print call per line
+    lines = []
+    for count, item in enumerate(chain([first_item], items), 1):
+        lines.append(f"File: {item.get('filename', 'Unknown')}\n")
+        lines.append(f"  Action: {item.get('action', 'Unknown')}\n")
+        lines.append(f"  Original path: {item.get('original_path', 'Unknown')}\n")
         if item.get('destination'):
-            print(f"  Moved to: {item.get('destination')}")
-        print(f"  Timestamp: {item.get('timestamp', 'Unknown')}")
-        print()
+            lines.append(f"  Moved to: {item.get('destination')}\n")
+        lines.append(f"  Timestamp: {item.get('timestamp', 'Unknown')}\n\n")
+        if count % PRINT_BATCH_SIZE == 0:
+            sys.stdout.write(''.join(lines))
+            lines.clear()
+    sys.stdout.write(''.join(lines))
 
 
 def clear_state(persistence_manager: PersistenceManager, what: str):
@@ -65,7 +79,7 @@ def clear_state(persistence_manager: PersistenceManager, what: str):
         persistence_manager.clear_handled_items()
         print("Handled items data cleared.")
     elif what == "iterator":
-        persistence_manager.save_iterator_state([], 0)
+        persistence_manager.clear_iterator_state()
         print("Iterator state cleared.")
     else:
         print(f"Unknown clear target: {what}")
@@ -88,6 +102,16 @@ def import_state(persistence_manager: PersistenceManager, import_path: str):
         print("Failed to import state.")
 
 
+# command -> (handler, whether the command takes a target argument)
+COMMANDS = {
+    'summary': (print_summary, False),
+    'list': (print_detailed_items, False),
+    'clear': (clear_state, True),
+    'export': (export_state, True),
+    'import': (import_state, True),
+}
+
+
 def main():
     """Main CLI interface."""
     parser = argparse.ArgumentParser(
@@ -106,7 +130,7 @@ Examples:
     
     parser.add_argument(
         'command',
-        choices=['summary', 'list', 'clear', 'export', 'import'],
+        choices=list(COMMANDS),
         help='Action to perform'
     )
     
@@ -118,8 +142,10 @@ Examples:
     
     args = parser.parse_args()
     
+    handler, needs_target = COMMANDS[args.command]
+    
     # Validate arguments
-    if args.command in ['clear', 'export', 'import'] and not args.target:
+    if needs_target and not args.target:
         print(f"Error: {args.command} command requires a target argument")
         parser.print_help()
         sys.exit(1)
@@ -133,20 +159,10 @@ Examples:
     
     # Execute command
     try:
-        if args.command == 'summary':
-            print_summary(persistence_manager)
-        
-        elif args.command == 'list':
-            print_detailed_items(persistence_manager)
-        
-        elif args.command == 'clear':
-            clear_state(persistence_manager, args.target)
-        
-        elif args.command == 'export':
-            export_state(persistence_manager, args.target)
-        
-        elif args.command == 'import':
-            import_state(persistence_manager, args.target)
+        if needs_target:
+            handler(persistence_manager, args.target)
+        else:
+            handler(persistence_manager)
     
     except Exception as e:
         print(f"Error executing command: {e}")